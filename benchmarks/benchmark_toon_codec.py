@@ -1,17 +1,43 @@
-"""Simple perf_counter-based benchmarks for pytoon-codec."""
+"""Simple timeit-based benchmarks for pytoon-codec."""
 
 from __future__ import annotations
 
 import argparse
+import cProfile
 import json
+import pstats
+import sys
 from collections.abc import Callable
-from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from timeit import Timer
 from typing import Any
 
-from benchmarks.generate_payloads import generate_events, generate_metrics
+from benchmarks.generate_payloads import (
+    cached_payload,
+    generate_events,
+    generate_metrics,
+    generate_metrics_columnar,
+    generate_metrics_delta,
+    payload_digest,
+)
+from benchmarks.structs import generate_metrics_struct
 from pytoon_codec import ToonCodec
 
-PayloadBuilder = Callable[[int], dict[str, Any]]
+PayloadBuilder = Callable[[int], Any]
+
+SUITES: list[tuple[str, PayloadBuilder]] = [
+    ("Time-series metrics", generate_metrics),
+    ("Time-series metrics (delta timestamps)", generate_metrics_delta),
+    ("Nested events", generate_events),
+]
+
+# Row representations compared by --build-cost (payload construction only)
+BUILD_COST_BUILDERS: list[tuple[str, PayloadBuilder]] = [
+    ("dict rows", generate_metrics),
+    ("header + tuple rows", generate_metrics_columnar),
+    ("slotted dataclass rows", generate_metrics_struct),
+]
 
 
 def _measure_suite(
@@ -20,53 +46,195 @@ def _measure_suite(
     codec: ToonCodec,
     sizes: list[int],
     repeats: int,
+    warmup: int,
+    profile: bool = False,
 ) -> dict[str, Any]:
-    results = []
+    results = [
+        _measure_one(name, builder, codec, n_rows, repeats, warmup, profile)
+        for n_rows in sizes
+    ]
+    return {"name": name, "results": results}
 
-    for n_rows in sizes:
-        encode_times: list[float] = []
-        decode_times: list[float] = []
 
-        for _ in range(repeats):
-            payload = builder(n_rows)
+def _measure_one(
+    name: str,
+    builder: PayloadBuilder,
+    codec: ToonCodec,
+    n_rows: int,
+    repeats: int,
+    warmup: int,
+    profile: bool = False,
+) -> dict[str, Any]:
+    encode_times: list[float] = []
+    decode_times: list[float] = []
+
+    # Build once per size so repeats only measure the codec
+    payload = builder(n_rows)
+    toon = codec.encode(payload)
 
-            start = perf_counter()
-            toon = codec.encode(payload)
-            encode_times.append(perf_counter() - start)
+    # Verify the round-trip once per size, outside the measured loop
+    expected = payload_digest(payload)
+    decoded = codec.decode(toon)
+    assert payload_digest(decoded) == expected, "Benchmark round-trip failed"
 
-            start = perf_counter()
-            decoded = codec.decode(toon)
-            decode_times.append(perf_counter() - start)
+    # Untimed passes so first-call costs do not skew the measurements
+    for _ in range(warmup):
+        codec.decode(codec.encode(payload))
 
-            assert decoded == payload, "Benchmark round-trip failed"
+    if profile:
+        _profile_roundtrip(f"{name} ({n_rows} rows)", codec, payload)
 
-        avg_encode = sum(encode_times) / repeats
-        avg_decode = sum(decode_times) / repeats
+    # Timer disables GC while timing; autorange picks a loop count large
+    # enough that short runs are not dominated by timer resolution.
+    encode_timer = Timer(partial(codec.encode, payload))
+    decode_timer = Timer(partial(codec.decode, toon))
+    encode_number, _ = encode_timer.autorange()
+    decode_number, _ = decode_timer.autorange()
 
-        results.append(
-            {
-                "rows": n_rows,
-                "encode_seconds": avg_encode,
-                "decode_seconds": avg_decode,
-                "total_seconds": avg_encode + avg_decode,
-            }
+    # Stdlib (C-accelerated) JSON encode of the same payload as a reference
+    json_timer = Timer(partial(json.dumps, payload))
+    json_number, _ = json_timer.autorange()
+    json_times: list[float] = []
+
+    # encode_into appends to a caller-owned buffer; clearing it between
+    # calls reuses the allocation instead of building a new str each time
+    encode_into_timer = Timer(partial(_encode_into_reused, codec, payload, bytearray()))
+    encode_into_number, _ = encode_into_timer.autorange()
+    encode_into_times: list[float] = []
+
+    for _ in range(repeats):
+        encode_times.append(encode_timer.timeit(encode_number) / encode_number)
+        decode_times.append(decode_timer.timeit(decode_number) / decode_number)
+        json_times.append(json_timer.timeit(json_number) / json_number)
+        encode_into_times.append(
+            encode_into_timer.timeit(encode_into_number) / encode_into_number
         )
 
-    return {"name": name, "results": results}
+    avg_encode = sum(encode_times) / repeats
+    avg_decode = sum(decode_times) / repeats
+    min_encode = min(encode_times)
+    min_decode = min(decode_times)
+    avg_encode_into = sum(encode_into_times) / repeats
+
+    return {
+        "rows": n_rows,
+        "chars": len(toon),
+        "encode_seconds": avg_encode,
+        "decode_seconds": avg_decode,
+        "total_seconds": avg_encode + avg_decode,
+        "encode_min_seconds": min_encode,
+        "decode_min_seconds": min_decode,
+        "total_min_seconds": min_encode + min_decode,
+        "json_encode_seconds": sum(json_times) / repeats,
+        "encode_into_seconds": avg_encode_into,
+        "encode_chars_per_second": len(toon) / avg_encode,
+        "encode_into_chars_per_second": len(toon) / avg_encode_into,
+    }
+
+
+def _measure_one_isolated(
+    name: str, builder: PayloadBuilder, n_rows: int, repeats: int, warmup: int
+) -> dict[str, Any]:
+    """Worker entry point for --parallel: one fresh codec per measurement."""
+    return _measure_one(name, builder, ToonCodec(), n_rows, repeats, warmup)
+
+
+def _measure_suites_parallel(
+    suites: list[tuple[str, PayloadBuilder]],
+    sizes: list[int],
+    repeats: int,
+    warmup: int,
+) -> list[dict[str, Any]]:
+    """Measure every (suite, size) pair in a separate worker process.
+
+    Builders must be picklable (module-level functions or partials of them).
+    Workers share caches and memory bandwidth, so timings are noisier than a
+    sequential run; this shortens CI wall-clock time rather than replacing
+    sequential numbers for comparisons.
+    """
+    with ProcessPoolExecutor(max_workers=len(sizes)) as executor:
+        futures = [
+            [
+                executor.submit(
+                    _measure_one_isolated, name, builder, n_rows, repeats, warmup
+                )
+                for n_rows in sizes
+            ]
+            for name, builder in suites
+        ]
+        return [
+            {"name": name, "results": [future.result() for future in pending]}
+            for (name, _), pending in zip(suites, futures, strict=True)
+        ]
+
+
+def _encode_into_reused(codec: ToonCodec, payload: Any, buffer: bytearray) -> None:
+    buffer.clear()
+    codec.encode_into(payload, buffer)
+
+
+def _profile_roundtrip(label: str, codec: ToonCodec, payload: Any) -> None:
+    """Profile one untimed encode/decode pass and print the top functions."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    codec.decode(codec.encode(payload))
+    profiler.disable()
+
+    # stderr keeps --json output on stdout machine-readable
+    sys.stderr.write(f"== profile: {label} ==\n")
+    stats = pstats.Stats(profiler, stream=sys.stderr)
+    stats.sort_stats("cumulative").print_stats(25)
+
+
+def _measure_build_cost(sizes: list[int], repeats: int) -> dict[str, Any]:
+    results = []
+
+    for n_rows in sizes:
+        row: dict[str, Any] = {"rows": n_rows}
+        for label, builder in BUILD_COST_BUILDERS:
+            timer = Timer(partial(builder, n_rows))
+            number, _ = timer.autorange()
+            # Mean over repeats, like the encode/decode columns
+            times = timer.repeat(repeat=repeats, number=number)
+            row[label] = sum(times) / (repeats * number)
+        results.append(row)
+
+    return {"name": "Metrics payload build cost", "results": results}
+
+
+def _print_build_cost(summary: dict[str, Any]) -> None:
+    headers = [f"{label} (s)" for label, _ in BUILD_COST_BUILDERS]
+    width = max(len(header) for header in headers)
+    lines = [
+        f"== {summary['name']} ==",
+        f"{'rows':>8} | " + " | ".join(f"{header:>{width}}" for header in headers),
+        "-" * (8 + (width + 3) * len(headers)),
+    ]
+    lines.extend(
+        f"{row['rows']:8d} | "
+        + " | ".join(f"{row[label]:{width}.4f}" for label, _ in BUILD_COST_BUILDERS)
+        for row in summary["results"]
+    )
+    sys.stdout.write("\n".join(lines) + "\n\n")
+
+
+_ROW_FORMAT = (
+    "{rows:8d} | {chars:10d} | "
+    "{encode_seconds:10.4f} | {decode_seconds:10.4f} | {total_seconds:10.4f} | "
+    "{json_encode_seconds:17.4f} | {encode_into_seconds:17.4f}"
+)
 
 
 def _print_table(summary: dict[str, Any]) -> None:
-    print(f"== {summary['name']} ==")
-    print(f"{'rows':>8} | {'encode (s)':>10} | {'decode (s)':>10} | {'total (s)':>10}")
-    print("-" * 48)
-    for row in summary["results"]:
-        print(
-            f"{row['rows']:8d} | "
-            f"{row['encode_seconds']:10.4f} | "
-            f"{row['decode_seconds']:10.4f} | "
-            f"{row['total_seconds']:10.4f}"
-        )
-    print()
+    lines = [
+        f"== {summary['name']} ==",
+        f"{'rows':>8} | {'chars':>10} | "
+        f"{'encode (s)':>10} | {'decode (s)':>10} | {'total (s)':>10} | "
+        f"{'json encode (s)':>17} | {'encode_into (s)':>17}",
+        "-" * 101,
+    ]
+    lines.extend(_ROW_FORMAT.format_map(row) for row in summary["results"])
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -84,6 +252,32 @@ def parse_args() -> argparse.Namespace:
         default=1,
         help="number of times to repeat each measurement (default: 1)",
     )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="untimed encode/decode passes per size before measuring (default: 1)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse payloads pickled under benchmarks/_cache instead of rebuilding",
+    )
+    parser.add_argument(
+        "--build-cost",
+        action="store_true",
+        help="also time payload construction for dict vs tuple metrics rows",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print cProfile stats (to stderr) for one round-trip per size",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="measure each size in a separate worker process (not with --profile)",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -96,22 +290,50 @@ def main() -> None:
     args = parse_args()
     if args.repeat <= 0:
         raise ValueError("--repeat must be positive")
+    if args.warmup < 0:
+        raise ValueError("--warmup must be non-negative")
+
+    if args.parallel and args.profile:
+        raise ValueError("--parallel cannot be combined with --profile")
 
-    codec = ToonCodec()
-    suites = [
-        _measure_suite(
-            "Time-series metrics", generate_metrics, codec, args.sizes, args.repeat
-        ),
-        _measure_suite(
-            "Nested events", generate_events, codec, args.sizes, args.repeat
-        ),
+    selected: list[tuple[str, PayloadBuilder]] = [
+        (name, partial(cached_payload, builder) if args.cache else builder)
+        for name, builder in SUITES
     ]
 
+    if args.parallel:
+        suites = _measure_suites_parallel(
+            selected, args.sizes, args.repeat, args.warmup
+        )
+    else:
+        codec = ToonCodec()
+        suites = [
+            _measure_suite(
+                name,
+                builder,
+                codec,
+                args.sizes,
+                args.repeat,
+                args.warmup,
+                args.profile,
+            )
+            for name, builder in selected
+        ]
+
+    build_cost = None
+    if args.build_cost:
+        build_cost = _measure_build_cost(args.sizes, args.repeat)
+
     if args.json:
-        print(json.dumps(suites, indent=2))
+        # Always the list of suite summaries; with --build-cost its summary
+        # is appended as one more entry in the same {"name", "results"} form
+        output = suites if build_cost is None else [*suites, build_cost]
+        print(json.dumps(output, indent=2))
     else:
         for summary in suites:
             _print_table(summary)
+        if build_cost is not None:
+            _print_build_cost(build_cost)
 
 
 if __name__ == "__main__":
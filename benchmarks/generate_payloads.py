@@ -2,12 +2,100 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, timedelta
+from itertools import cycle
+from pathlib import Path
 from typing import Any
 
 from pytoon_codec import ToonCodec
 
-__all__ = ["generate_events", "generate_metrics", "roundtrip"]
+__all__ = [
+    "cached_payload",
+    "generate_events",
+    "generate_metrics",
+    "generate_metrics_columnar",
+    "generate_metrics_delta",
+    "payload_digest",
+    "roundtrip",
+]
+
+CACHE_DIR = Path(__file__).with_name("_cache")
+
+# conversion_rate only takes 10 distinct values; index instead of rounding
+_CONVERSION_RATES = tuple(round(0.05 + idx * 0.001, 4) for idx in range(10))
+
+# Categorical event values, interned once so every row (and every payload built
+# in this process) references the same string objects.
+_EVENT_SENSORS = tuple(
+    (sys.intern(event_type), sys.intern(sensor_name))
+    for event_type, sensor_name in (
+        ("motion", "sensor_motion"),
+        ("door", "sensor_door"),
+        ("light", "sensor_light"),
+    )
+)
+_EVENT_ROOMS = tuple(map(sys.intern, ("bathroom", "kitchen")))
+_EVENT_ZONES = tuple(map(sys.intern, ("main", "entry", "entry")))
+
+
+def _iso_timestamps(base: datetime, step_seconds: int, n_rows: int) -> list[str]:
+    """
+    Return ``n_rows`` ISO timestamps spaced ``step_seconds`` apart from ``base``.
+
+    Offsets are plain integer seconds; date and time-of-day strings are
+    formatted once per distinct value and concatenated day by day. Bases
+    carrying microseconds or a timezone fall back to ``datetime`` arithmetic
+    so the output always matches ``isoformat()``.
+    """
+    if base.microsecond or base.tzinfo is not None:
+        step = timedelta(seconds=step_seconds)
+        return [(base + step * idx).isoformat() for idx in range(n_rows)]
+
+    first_ordinal = base.toordinal()
+    offset = base.hour * 3600 + base.minute * 60 + base.second
+    day_times: dict[int, list[str]] = {}
+    timestamps: list[str] = []
+
+    # Emit one day at a time: rows within a day share the date prefix, and
+    # extend() with a sized list grows the result once per day rather than
+    # once per appended row.
+    while len(timestamps) < n_rows:
+        day, first_second = divmod(offset, 86_400)
+        times = day_times.get(first_second)
+        if times is None:
+            times = [
+                f"T{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}"
+                for second in range(first_second, 86_400, step_seconds)
+            ]
+            day_times[first_second] = times
+        times = times[: n_rows - len(timestamps)]
+        date_part = date.fromordinal(first_ordinal + day).isoformat()
+        timestamps.extend([date_part + time_part for time_part in times])
+        offset += step_seconds * len(times)
+
+    return timestamps
+
+
+def _metric_values(n_rows: int) -> Iterator[tuple[int, int, float]]:
+    """
+    Yield ``(views, clicks, conversion_rate)`` for each metrics row.
+
+    Each column is built in a single pass and zipped, so the per-row work in
+    the callers is one dict display instead of arithmetic plus appends.
+    """
+    indices = range(n_rows)
+    views = range(1000, 1000 + 3 * n_rows, 3)
+    clicks = [50 + idx % 20 for idx in indices]
+    conversion_rates = [_CONVERSION_RATES[idx % 10] for idx in indices]
+    return zip(views, clicks, conversion_rates, strict=True)
 
 
 def generate_metrics(n_rows: int, *, start: datetime | None = None) -> dict[str, Any]:
@@ -18,31 +106,94 @@ def generate_metrics(n_rows: int, *, start: datetime | None = None) -> dict[str,
         raise ValueError("n_rows must be positive")
 
     base = start or datetime(2025, 1, 1)
-    rows: list[dict[str, Any]] = []
-    for idx in range(n_rows):
-        current = base + timedelta(minutes=idx * 10)
-        rows.append(
-            {
-                "timestamp": current.isoformat(),
-                "views": 1000 + idx * 3,
-                "clicks": 50 + (idx % 20),
-                "conversion_rate": round(0.05 + (idx % 10) * 0.001, 4),
-            }
+    timestamps = _iso_timestamps(base, 10 * 60, n_rows)
+
+    rows: list[dict[str, Any]] = [
+        {
+            "timestamp": timestamp,
+            "views": view_count,
+            "clicks": click_count,
+            "conversion_rate": rate,
+        }
+        for timestamp, (view_count, click_count, rate) in zip(
+            timestamps, _metric_values(n_rows), strict=True
         )
+    ]
 
     return {
         "dashboard": "benchmarks-demo",
         "window": {
-            "start": base.isoformat(),
-            "end": (base + timedelta(minutes=(n_rows - 1) * 10)).isoformat(),
+            "start": rows[0]["timestamp"],
+            "end": rows[-1]["timestamp"],
         },
         "metrics": rows,
     }
 
 
+def generate_metrics_delta(
+    n_rows: int, *, start: datetime | None = None
+) -> dict[str, Any]:
+    """
+    Create the :func:`generate_metrics` series with delta-encoded timestamps.
+
+    Rows carry a step index ``dt`` instead of an ISO timestamp; the original
+    time is ``base + dt * step_minutes``. Useful for comparing TOON size and
+    codec time against the full-timestamp representation.
+    """
+    if n_rows <= 0:
+        raise ValueError("n_rows must be positive")
+
+    base = start or datetime(2025, 1, 1)
+    rows: list[dict[str, Any]] = [
+        {
+            "dt": idx,
+            "views": view_count,
+            "clicks": click_count,
+            "conversion_rate": rate,
+        }
+        for idx, (view_count, click_count, rate) in enumerate(_metric_values(n_rows))
+    ]
+
+    return {
+        "dashboard": "benchmarks-demo",
+        "base": base.isoformat(),
+        "step_minutes": 10,
+        "metrics": rows,
+    }
+
+
+def generate_metrics_columnar(
+    n_rows: int, *, start: datetime | None = None
+) -> dict[str, Any]:
+    """
+    Create the :func:`generate_metrics` rows as a shared header plus tuples.
+
+    ToonCodec cannot encode arrays of arrays, so this shape is only used to
+    measure how much of the builder cost is per-row dict construction.
+    """
+    if n_rows <= 0:
+        raise ValueError("n_rows must be positive")
+
+    base = start or datetime(2025, 1, 1)
+    timestamps = _iso_timestamps(base, 10 * 60, n_rows)
+
+    return {
+        "metrics_header": ("timestamp", "views", "clicks", "conversion_rate"),
+        "metrics_rows": [
+            (timestamp, *values)
+            for timestamp, values in zip(
+                timestamps, _metric_values(n_rows), strict=True
+            )
+        ],
+    }
+
+
 def generate_events(n_rows: int, *, start: datetime | None = None) -> dict[str, Any]:
     """
     Create a nested event log payload with repeated users/payloads.
+
+    Rows reuse a small set of ``payload`` and ``user`` dicts, so the returned
+    rows share references; treat the payload as read-only.
     """
     if n_rows <= 0:
         raise ValueError("n_rows must be positive")
@@ -53,29 +204,37 @@ def generate_events(n_rows: int, *, start: datetime | None = None) -> dict[str,
         {"id": 202, "name": "Bob"},
         {"id": 303, "name": "Charlie"},
     ]
-    sensors = [
-        ("motion", "sensor_motion"),
-        ("door", "sensor_door"),
-        ("light", "sensor_light"),
-    ]
+    sensors = _EVENT_SENSORS
+    rooms = _EVENT_ROOMS
+    zones = _EVENT_ZONES
 
-    rows: list[dict[str, Any]] = []
-    for idx in range(n_rows):
-        ts = base + timedelta(seconds=idx * 45)
-        event_type, sensor_name = sensors[idx % len(sensors)]
-        user = users[idx % len(users)]
-        rows.append(
+    # Every per-row choice repeats with a period dividing 6, so precompute the
+    # six distinct (type, payload, user) combinations once and cycle through
+    # them. Rows therefore share their ``payload``/``user`` dicts.
+    period = 6
+    templates = [
+        (
+            sensors[idx % len(sensors)][0],
             {
-                "timestamp": ts.isoformat() + "Z",
-                "type": event_type,
-                "payload": {
-                    "sensor": sensor_name,
-                    "room": "bathroom" if idx % 2 == 0 else "kitchen",
-                    "zone": "main" if idx % 3 == 0 else "entry",
-                },
-                "user": user,
-            }
+                "sensor": sensors[idx % len(sensors)][1],
+                "room": rooms[idx % len(rooms)],
+                "zone": zones[idx % len(zones)],
+            },
+            users[idx % len(users)],
         )
+        for idx in range(period)
+    ]
+
+    timestamps = _iso_timestamps(base, 45, n_rows)
+    rows: list[dict[str, Any]] = [
+        {
+            "timestamp": timestamp + "Z",
+            "type": event_type,
+            "payload": payload,
+            "user": user,
+        }
+        for timestamp, (event_type, payload, user) in zip(timestamps, cycle(templates))
+    ]
 
     return {
         "device_id": "iot-benchmark-unit",
@@ -87,3 +246,54 @@ def generate_events(n_rows: int, *, start: datetime | None = None) -> dict[str,
 def roundtrip(codec: ToonCodec, payload: dict[str, Any]) -> None:
     toon = codec.encode(payload)
     codec.decode(toon)
+
+
+def payload_digest(payload: Any) -> bytes:
+    """
+    Return a BLAKE2b digest of the payload's canonical JSON form.
+
+    Keys are sorted and the C JSON encoder is used, so two payloads have the
+    same digest exactly when they serialize identically; unlike ``==`` this
+    also tells ``1`` from ``1.0`` and ``True``.
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+def cached_payload(
+    builder: Callable[..., dict[str, Any]],
+    n_rows: int,
+    *,
+    start: datetime | None = None,
+    cache_dir: Path = CACHE_DIR,
+) -> dict[str, Any]:
+    """
+    Return ``builder(n_rows, start=start)``, memoised as a pickle on disk.
+
+    The cache key is ``(builder name, n_rows, start)`` plus a hash of the
+    source file defining ``builder``, so editing a builder (or a helper next
+    to it) regenerates its payloads. The pickle is written to a temporary
+    file and renamed into place, so an interrupted run never leaves a
+    truncated entry behind.
+    """
+    source = Path(inspect.getsourcefile(builder) or __file__).read_bytes()
+    source_stamp = hashlib.blake2b(source, digest_size=8).hexdigest()
+    stamp = start.isoformat().replace(":", "-") if start else "default"
+    path = cache_dir / f"{builder.__name__}_{n_rows}_{stamp}_{source_stamp}.pkl"
+
+    if path.exists():
+        with path.open("rb") as fh:
+            payload: dict[str, Any] = pickle.load(fh)
+        return payload
+
+    payload = builder(n_rows, start=start)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return payload
@@ -0,0 +1,33 @@
+"""Fixed-schema row types used as a baseline for benchmark payload builders."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from benchmarks.generate_payloads import generate_metrics_columnar
+
+__all__ = ["MetricRow", "generate_metrics_struct"]
+
+
+@dataclass(frozen=True, slots=True)
+class MetricRow:
+    """One metrics row with the same fields as :func:`generate_metrics` rows."""
+
+    timestamp: str
+    views: int
+    clicks: int
+    conversion_rate: float
+
+
+def generate_metrics_struct(
+    n_rows: int, *, start: datetime | None = None
+) -> list[MetricRow]:
+    """
+    Create the :func:`generate_metrics` series as slotted ``MetricRow`` objects.
+
+    Slotted instances carry no per-row ``__dict__``, so this isolates how much
+    of the builder cost comes from the row container itself.
+    """
+    rows = generate_metrics_columnar(n_rows, start=start)["metrics_rows"]
+    return [MetricRow(*values) for values in rows]
@@ -0,0 +1,54 @@
+"""Shared codec instance and sample payloads used by the example scripts.
+
+Payloads are built once at import time and wrapped in read-only mappings so the
+scripts can share them without accidentally mutating each other's data.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from pytoon_codec import ToonCodec
+
+CODEC = ToonCodec()
+
+METRICS_PAYLOAD: Mapping[str, Any] = MappingProxyType(
+    {
+        "project": "analytics-dashboard",
+        "metrics": [
+            {"date": "2025-01-01", "views": 1250, "clicks": 89},
+            {"date": "2025-01-02", "views": 1340, "clicks": 102},
+            {"date": "2025-01-03", "views": 1180, "clicks": 76},
+        ],
+    }
+)
+
+EVENTS_PAYLOAD: Mapping[str, Any] = MappingProxyType(
+    {
+        "log_title": "Bathroom Sensor Events",
+        "events": [
+            {
+                "timestamp": "2025-01-15T08:30:00Z",
+                "type": "motion",
+                "payload": {"sensor": "toilet", "room": "bathroom", "zone": "main"},
+                "user": {"id": 123, "name": "Alice"},
+            },
+            {
+                "timestamp": "2025-01-15T08:35:00Z",
+                "type": "door",
+                "payload": {"sensor": "main_door", "room": "bathroom", "zone": "entry"},
+                "user": {"id": 123, "name": "Alice"},
+            },
+        ],
+    }
+)
+
+# Combined metrics + events payload embedded in the LLM prompt examples
+LLM_PAYLOAD: Mapping[str, Any] = MappingProxyType(
+    {
+        "metrics": METRICS_PAYLOAD["metrics"],
+        "events": EVENTS_PAYLOAD["events"],
+    }
+)
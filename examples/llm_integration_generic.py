@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Protocol
 
-from pytoon_codec import ToonCodec
+from _common import CODEC, LLM_PAYLOAD
 
 
 class LLMClient(Protocol):
@@ -17,27 +17,8 @@ def call_llm(model_name: str, prompt: str) -> str:
     return f"[example response from {model_name}]"
 
 
-def build_example_payload() -> dict:
-    return {
-        "metrics": [
-            {"date": "2025-01-01", "views": 1250, "clicks": 89},
-            {"date": "2025-01-02", "views": 1340, "clicks": 102},
-        ],
-        "events": [
-            {
-                "timestamp": "2025-01-15T08:30:00Z",
-                "type": "motion",
-                "payload": {"sensor": "toilet", "room": "bathroom"},
-                "user": {"id": 123, "name": "Alice"},
-            }
-        ],
-    }
-
-
 def main() -> None:
-    codec = ToonCodec()
-    payload = build_example_payload()
-    toon = codec.encode(payload)
+    toon = CODEC.encode(LLM_PAYLOAD)
 
     prompt = f"""Summarise the following structured telemetry (TOON format).
 
@@ -49,7 +30,7 @@ Return insights in plain English."""
     print(result)
 
     # If the LLM responds with TOON, decode back:
-    # decoded = codec.decode(result_from_llm)
+    # decoded = CODEC.decode(result_from_llm)
 
 
 if __name__ == "__main__":
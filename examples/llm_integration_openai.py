@@ -2,31 +2,11 @@
 
 from __future__ import annotations
 
-from pytoon_codec import ToonCodec
-
-
-def build_example_payload() -> dict:
-    return {
-        "metrics": [
-            {"date": "2025-01-01", "views": 1250, "clicks": 89},
-            {"date": "2025-01-02", "views": 1340, "clicks": 102},
-            {"date": "2025-01-03", "views": 1180, "clicks": 76},
-        ],
-        "events": [
-            {
-                "timestamp": "2025-01-15T08:30:00Z",
-                "type": "motion",
-                "payload": {"sensor": "toilet", "room": "bathroom"},
-                "user": {"id": 123, "name": "Alice"},
-            }
-        ],
-    }
+from _common import CODEC, LLM_PAYLOAD
 
 
 def main() -> None:
-    codec = ToonCodec()
-    payload = build_example_payload()
-    toon = codec.encode(payload)
+    toon = CODEC.encode(LLM_PAYLOAD)
 
     prompt = f"""You are a data assistant.
 
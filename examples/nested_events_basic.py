@@ -6,39 +6,17 @@ Run with:
 
 from __future__ import annotations
 
-from pytoon_codec import ToonCodec
-
-
-def build_events_payload() -> dict:
-    """Return a small payload representing nested bathroom sensor events."""
-    return {
-        "log_title": "Bathroom Sensor Events",
-        "events": [
-            {
-                "timestamp": "2025-01-15T08:30:00Z",
-                "type": "motion",
-                "payload": {"sensor": "toilet", "room": "bathroom", "zone": "main"},
-                "user": {"id": 123, "name": "Alice"},
-            },
-            {
-                "timestamp": "2025-01-15T08:35:00Z",
-                "type": "door",
-                "payload": {"sensor": "main_door", "room": "bathroom", "zone": "entry"},
-                "user": {"id": 123, "name": "Alice"},
-            },
-        ],
-    }
+from _common import CODEC, EVENTS_PAYLOAD
 
 
 def main() -> None:
-    codec = ToonCodec()
-    payload = build_events_payload()
+    payload = EVENTS_PAYLOAD
 
-    toon = codec.encode(payload)
+    toon = CODEC.encode(payload)
     print("Encoded TOON:\n")
     print(toon)
     print("\nDecoded payload:")
-    decoded = codec.decode(toon)
+    decoded = CODEC.decode(toon)
     print(decoded)
 
     assert decoded == payload, "Round-trip mismatch!"
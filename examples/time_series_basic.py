@@ -6,43 +6,17 @@ Run with:
 
 from __future__ import annotations
 
-from datetime import date
-
-from pytoon_codec import ToonCodec
-
-
-def build_metrics_payload() -> dict:
-    """Return a small metrics payload keyed by ISO dates."""
-    base = date(2025, 1, 1)
-    metrics = []
-    for offset, views, clicks in [
-        (0, 1250, 89),
-        (1, 1340, 102),
-        (2, 1180, 76),
-    ]:
-        metrics.append(
-            {
-                "date": (base.fromordinal(base.toordinal() + offset)).isoformat(),
-                "views": views,
-                "clicks": clicks,
-            }
-        )
-
-    return {
-        "project": "analytics-dashboard",
-        "metrics": metrics,
-    }
+from _common import CODEC, METRICS_PAYLOAD
 
 
 def main() -> None:
-    codec = ToonCodec()
-    payload = build_metrics_payload()
+    payload = METRICS_PAYLOAD
 
-    toon = codec.encode(payload)
+    toon = CODEC.encode(payload)
     print("Encoded TOON:\n")
     print(toon)
     print("\nDecoded payload:")
-    decoded = codec.decode(toon)
+    decoded = CODEC.decode(toon)
     print(decoded)
 
     assert decoded == payload, "Round-trip mismatch!"
@@ -41,11 +41,14 @@ Public API
 
 from __future__ import annotations
 
-from .pytoon_codec import (
-    ToonCodec,
-    ToonDecodingError,
-    ToonEncodingError,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pytoon_codec import (
+        ToonCodec,
+        ToonDecodingError,
+        ToonEncodingError,
+    )
 
 __all__ = [
     "ToonCodec",
@@ -53,11 +56,32 @@ __all__ = [
     "ToonEncodingError",
 ]
 
-# Version information
-try:
-    from importlib.metadata import version
 
-    __version__ = version("pytoon-codec")
-except Exception:
-    # Fallback if package is not installed or importlib.metadata unavailable
-    __version__ = "0.2.0"
+def _read_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("pytoon-codec")
+    except Exception:
+        # Fallback if package is not installed or importlib.metadata unavailable
+        return "0.2.0"
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 lazy attributes: the codec module and package metadata are only
+    # loaded when first accessed, then cached as regular module globals.
+    if name in __all__:
+        from . import pytoon_codec as _codec_module
+
+        value = getattr(_codec_module, name)
+    elif name == "__version__":
+        value = _read_version()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, "__version__"})
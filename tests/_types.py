@@ -0,0 +1,10 @@
+"""
+Type aliases shared by the test modules.
+
+Kept out of ``conftest.py``, which pytest loads itself and which should not
+be imported as a regular module.
+"""
+
+from collections.abc import Callable
+
+RoundTrip = Callable[..., str]
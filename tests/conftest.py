@@ -0,0 +1,87 @@
+"""
+Shared pytest fixtures.
+
+ToonCodec instances hold no per-call state, so one instance per
+configuration is shared across the whole test session. Under pytest-xdist
+each worker process builds its own session fixtures, so the tests need no
+xdist_group pinning to run in parallel.
+"""
+
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from benchmarks.generate_payloads import generate_metrics
+from pytoon_codec import ToonCodec
+from tests._types import RoundTrip
+
+BASELINE_FILE = Path(__file__).with_name("perf_baseline.json")
+
+
+def _assert_roundtrip(
+    codec: ToonCodec, data: dict[str, Any], *, contains: Iterable[str] = ()
+) -> str:
+    """Encode ``data``, check each fragment in ``contains``, decode and compare.
+
+    Returns the encoded text so callers can make further assertions on it.
+    The comparison is a plain ``==``: dict and list equality runs in C and
+    stops at the first difference, which is far cheaper than serialising
+    both sides to compare bytes.
+    """
+    toon = codec.encode(data)
+    for fragment in contains:
+        assert fragment in toon
+    assert codec.decode(toon) == data
+    return toon
+
+
+@pytest.fixture(scope="session")
+def codec() -> ToonCodec:
+    """Codec with default options."""
+    return ToonCodec()
+
+
+@pytest.fixture(scope="session")
+def codec_expand() -> ToonCodec:
+    """Codec that expands dotted keys into nested dicts on decode."""
+    return ToonCodec(expand_paths=True)
+
+
+@pytest.fixture(scope="session")
+def codec_flat() -> ToonCodec:
+    """Codec that keeps dotted keys flat on decode."""
+    return ToonCodec(expand_paths=False)
+
+
+@pytest.fixture(scope="session")
+def codec_columnar() -> ToonCodec:
+    """Codec that decodes tables as column lists and keeps dotted keys flat."""
+    return ToonCodec(expand_paths=False, decode_mode="columnar")
+
+
+@pytest.fixture(scope="session")
+def assert_roundtrip() -> RoundTrip:
+    """Helper asserting that ``codec.decode(codec.encode(data)) == data``."""
+    return _assert_roundtrip
+
+
+@pytest.fixture(scope="session")
+def perf_baseline() -> float:
+    """Metrics round-trip baseline in seconds, read once per session.
+
+    ``PYTOON_PERF_BASELINE_PATH`` points at an alternative baseline file.
+    """
+    override = os.environ.get("PYTOON_PERF_BASELINE_PATH")
+    path = Path(override) if override else BASELINE_FILE
+    data = json.loads(path.read_text())
+    return float(data["metrics_roundtrip_seconds"])
+
+
+@pytest.fixture(scope="module")
+def metrics_1k() -> dict[str, Any]:
+    """Deterministic 1000-row metrics payload, built once per test module."""
+    return generate_metrics(1_000)
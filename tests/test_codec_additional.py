@@ -1,20 +1,32 @@
 from __future__ import annotations
 
+import re
+from pathlib import Path
+
 import pytest
 
 from pytoon_codec import ToonCodec, ToonDecodingError, ToonEncodingError
 
-
-def test_encode_requires_mapping() -> None:
-    codec = ToonCodec()
-
-    with pytest.raises(TypeError, match="mapping"):
+_RX_MAPPING = re.compile("mapping")
+_RX_MIXED_TYPES = re.compile("mixed or unsupported element types")
+_RX_EXPECTS_STRING = re.compile("expects a string")
+_RX_UNTERMINATED = re.compile("Unterminated quoted value")
+_RX_DANGLING = re.compile("Dangling escape sequence")
+_RX_NO_ATTRIBUTE = re.compile("no attribute")
+_RX_BYTEARRAY = re.compile("bytearray")
+_RX_ALREADY = re.compile("already exists")
+_RX_DUPLICATE = re.compile("duplicate entries")
+_RX_INVALID_QUOTED_CELL = re.compile("Invalid quoted string cell")
+_RX_EXPECTS_MAPPINGS = re.compile("expects mappings")
+_RX_KEY_NOT_STRING = re.compile("key must be a string")
+
+
+def test_encode_requires_mapping(codec: ToonCodec) -> None:
+    with pytest.raises(TypeError, match=_RX_MAPPING):
         codec.encode(["not", "a", "mapping"])  # type: ignore[arg-type]
 
 
-def test_encode_mixed_list_types_raises() -> None:
-    codec = ToonCodec()
-
+def test_encode_mixed_list_types_raises(codec: ToonCodec) -> None:
     data = {
         "mixed": [
             {"timestamp": "2025-01-01", "value": 1},
@@ -22,28 +34,150 @@ def test_encode_mixed_list_types_raises() -> None:
         ]
     }
 
-    with pytest.raises(ToonEncodingError, match="mixed or unsupported element types"):
+    with pytest.raises(ToonEncodingError, match=_RX_MIXED_TYPES):
         codec.encode(data)
 
 
-def test_decode_requires_string_input() -> None:
-    codec = ToonCodec()
-
-    with pytest.raises(TypeError, match="expects a string"):
+def test_decode_requires_string_input(codec: ToonCodec) -> None:
+    with pytest.raises(TypeError, match=_RX_EXPECTS_STRING):
         codec.decode(123)  # type: ignore[arg-type]
 
 
-def test_decode_table_with_unterminated_quote_errors() -> None:
-    codec = ToonCodec()
+def test_decode_accepts_utf8_bytes_like_input(codec: ToonCodec) -> None:
+    data = {"title": "Café", "rows": [{"id": 1, "name": "Zoë"}, {"id": 2, "name": "x"}]}
+    raw = codec.encode(data).encode("utf-8")
+
+    assert codec.decode(raw) == data
+    assert codec.decode(bytearray(raw)) == data
+    assert codec.decode(memoryview(raw)) == data
+    assert list(codec.decode_stream(raw)) == list(codec.decode_stream(raw.decode()))
+    assert [name for name, _ in codec.iter_table(raw)] == ["rows"]
+    with pytest.raises(UnicodeDecodeError):
+        codec.decode(b"title: \xff")
+
+
+def test_decode_table_with_unterminated_quote_errors(codec: ToonCodec) -> None:
     toon = 'events[1]{name}:\n  "unterminated'
 
-    with pytest.raises(ToonDecodingError, match="Unterminated quoted value"):
+    with pytest.raises(ToonDecodingError, match=_RX_UNTERMINATED):
         codec.decode(toon)
 
 
-def test_decode_primitive_array_with_dangling_escape_errors() -> None:
-    codec = ToonCodec()
+def test_decode_primitive_array_with_dangling_escape_errors(codec: ToonCodec) -> None:
     toon = 'tags[1]: "dangling\\'
 
-    with pytest.raises(ToonDecodingError, match="Dangling escape sequence"):
+    with pytest.raises(ToonDecodingError, match=_RX_DANGLING):
         codec.decode(toon)
+
+
+def test_decode_table_mixed_quoted_and_unquoted_cells(codec: ToonCodec) -> None:
+    toon = 'rows[1]{a,b,c,d}:\n  "x \\"y\\", z",C:\\tmp,"",7'
+
+    assert codec.decode(toon) == {
+        "rows": [{"a": 'x "y", z', "b": "C:\\tmp", "c": "", "d": 7}]
+    }
+
+
+def test_package_lazy_exports_resolve() -> None:
+    import pytoon_codec
+
+    for name in pytoon_codec.__all__:
+        assert getattr(pytoon_codec, name) is not None
+    assert isinstance(pytoon_codec.__version__, str)
+
+    with pytest.raises(AttributeError, match=_RX_NO_ATTRIBUTE):
+        pytoon_codec.does_not_exist  # noqa: B018
+
+
+def test_encode_into_matches_encode_and_appends(codec: ToonCodec) -> None:
+    data = {
+        "title": "Café, menu",
+        "tags": ["a", "b"],
+        "events": [{"id": 1, "user": {"name": "Zoë"}}],
+    }
+    buffer = bytearray(b"prefix|")
+
+    written = codec.encode_into(data, buffer)
+
+    expected = codec.encode(data).encode("utf-8")
+    assert written == len(expected)
+    assert bytes(buffer) == b"prefix|" + expected
+
+
+@pytest.mark.parametrize(
+    ("bad_value", "error"),
+    [(object(), TypeError), ("\ud800", UnicodeEncodeError)],
+)
+def test_encode_into_leaves_buffer_unchanged_on_failure(
+    codec: ToonCodec, bad_value: object, error: type[Exception]
+) -> None:
+    buffer = bytearray(b"keep")
+
+    with pytest.raises(error):
+        codec.encode_into({"a": 1, "b": bad_value}, buffer)
+
+    assert bytes(buffer) == b"keep"
+
+
+def test_encode_into_requires_bytearray(codec: ToonCodec) -> None:
+    with pytest.raises(TypeError, match=_RX_BYTEARRAY):
+        codec.encode_into({"a": 1}, b"")  # type: ignore[arg-type]
+
+
+def test_decode_file_matches_decode(codec: ToonCodec, tmp_path: Path) -> None:
+    data = {
+        "title": "Café, menu",
+        "events": [
+            {"id": 1, "user": {"name": "Zoë"}},
+            {"id": 2, "user": {"name": "x"}},
+        ],
+    }
+    path = tmp_path / "data.toon"
+    path.write_bytes(codec.encode(data).replace("\n", "\r\n").encode("utf-8"))
+    empty = tmp_path / "empty.toon"
+    empty.write_bytes(b"")
+
+    assert codec.decode_file(path) == data
+    assert codec.decode_file(str(empty)) == {}
+
+
+def test_decode_stream_yields_dotted_pairs_in_order(codec: ToonCodec) -> None:
+    toon = "user.id: 1\ntags[2]: a,b"
+
+    assert list(codec.decode_stream(toon)) == [("user.id", 1), ("tags", ["a", "b"])]
+
+
+def test_decode_stream_duplicate_key_raises_after_first_pair(codec: ToonCodec) -> None:
+    stream = codec.decode_stream("a: 1\na: 2")
+
+    assert next(stream) == ("a", 1)
+    with pytest.raises(ToonDecodingError, match=_RX_ALREADY):
+        next(stream)
+
+
+def test_decode_without_expansion_rejects_duplicate_keys(codec_flat: ToonCodec) -> None:
+    with pytest.raises(ToonDecodingError, match=_RX_DUPLICATE):
+        codec_flat.decode("x: 1\nx: 2")
+
+
+def test_decode_quoted_cell_with_trailing_text_errors(codec: ToonCodec) -> None:
+    with pytest.raises(ToonDecodingError, match=_RX_INVALID_QUOTED_CELL):
+        codec.decode('note: "a" and "b"')
+
+
+def test_encode_many_matches_encode_per_record(codec: ToonCodec) -> None:
+    records = [
+        {"date": "2025-01-01", "views": 10, "rate": 0.5, "ok": True, "note": None},
+        {"date": "2025-01-02", "views": 12, "rate": 0.25, "ok": False, "note": "a, b"},
+        {"id": 3, "user": {"name": "Zoë"}, "tags": ["x", "y"]},
+    ]
+
+    assert codec.encode_many(records) == [codec.encode(r) for r in records]
+    assert codec.encode_many([]) == []
+
+
+def test_encode_many_rejects_non_mapping_and_non_string_keys(codec: ToonCodec) -> None:
+    with pytest.raises(TypeError, match=_RX_EXPECTS_MAPPINGS):
+        codec.encode_many([{"a": 1}, ["not", "a", "mapping"]])  # type: ignore[list-item]
+    with pytest.raises(TypeError, match=_RX_KEY_NOT_STRING):
+        codec.encode_many([{1: "a"}])  # type: ignore[dict-item]
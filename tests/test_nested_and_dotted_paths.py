@@ -2,31 +2,37 @@
 Unit tests for nested object flattening, dotted path expansion, and related edge cases.
 """
 
+import re
+
 import pytest
 
 from pytoon_codec import ToonCodec, ToonDecodingError, ToonEncodingError
+from tests._types import RoundTrip
+
+_RX_ARRAY_IN_OBJECT = re.compile("Arrays nested inside objects")
+_RX_ARRAY_IN_ROW = re.compile("Arrays nested inside tabular rows")
+_RX_CONFLICT = re.compile("conflict")
+_RX_ALREADY = re.compile("already exists")
 
 
 @pytest.mark.unit
-def test_encode_decode_nested_object_single_level() -> None:
+def test_encode_decode_nested_object_single_level(codec_expand: ToonCodec) -> None:
     """Test flattening and expanding single-level nested object."""
-    codec = ToonCodec(expand_paths=True)
-
     data = {"user": {"id": 123, "name": "Alice"}}
 
-    toon = codec.encode(data)
+    toon = codec_expand.encode(data)
     assert "user.id:" in toon or "user.id" in toon
     assert "user.name:" in toon or "user.name" in toon
 
-    decoded = codec.decode(toon)
+    decoded = codec_expand.decode(toon)
     assert decoded == data
 
 
 @pytest.mark.unit
-def test_encode_decode_nested_object_multi_level() -> None:
+def test_encode_decode_nested_object_multi_level(
+    codec_expand: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test flattening and expanding multi-level nested objects."""
-    codec = ToonCodec(expand_paths=True)
-
     data = {
         "metadata": {
             "user": {"profile": {"id": "u-1", "role": "admin"}},
@@ -34,41 +40,38 @@ def test_encode_decode_nested_object_multi_level() -> None:
         }
     }
 
-    toon = codec.encode(data)
-    assert "metadata.user.profile.id:" in toon
-    assert "metadata.user.profile.role:" in toon
-    assert "metadata.source:" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(
+        codec_expand,
+        data,
+        contains=[
+            "metadata.user.profile.id:",
+            "metadata.user.profile.role:",
+            "metadata.source:",
+        ],
+    )
 
 
 @pytest.mark.unit
-def test_encode_nested_object_with_various_types() -> None:
+def test_encode_nested_object_with_various_types(
+    codec_expand: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test nested object with different primitive types."""
-    codec = ToonCodec(expand_paths=True)
-
     data = {
         "config": {"enabled": True, "port": 8080, "timeout": 30.5, "description": None}
     }
 
-    toon = codec.encode(data)
-    decoded = codec.decode(toon)
-
-    assert decoded == data
+    assert_roundtrip(codec_expand, data)
 
 
 @pytest.mark.unit
-def test_decode_with_expand_paths_true() -> None:
+def test_decode_with_expand_paths_true(codec_expand: ToonCodec) -> None:
     """Test that expand_paths=True reconstructs nested dicts."""
-    codec = ToonCodec(expand_paths=True)
-
     toon = """metadata.user.id: u-1
 metadata.user.role: admin
 metadata.source: test
 """
 
-    decoded = codec.decode(toon)
+    decoded = codec_expand.decode(toon)
 
     assert decoded == {
         "metadata": {"user": {"id": "u-1", "role": "admin"}, "source": "test"}
@@ -76,15 +79,13 @@ metadata.source: test
 
 
 @pytest.mark.unit
-def test_decode_with_expand_paths_false() -> None:
+def test_decode_with_expand_paths_false(codec_flat: ToonCodec) -> None:
     """Test that expand_paths=False keeps dotted keys flat."""
-    codec = ToonCodec(expand_paths=False)
-
     toon = """metadata.user.id: u-1
 metadata.user.role: admin
 """
 
-    decoded = codec.decode(toon)
+    decoded = codec_flat.decode(toon)
 
     assert decoded == {
         "metadata.user.id": "u-1",
@@ -93,25 +94,21 @@ metadata.user.role: admin
 
 
 @pytest.mark.unit
-def test_encode_nested_arrays_in_object_raises() -> None:
+def test_encode_nested_arrays_in_object_raises(codec: ToonCodec) -> None:
     """Test that arrays nested inside objects raise ToonEncodingError."""
-    codec = ToonCodec()
-
     data = {
         "metadata": {
             "tags": ["a", "b", "c"],  # array inside nested object: unsupported
         }
     }
 
-    with pytest.raises(ToonEncodingError, match="Arrays nested inside objects"):
+    with pytest.raises(ToonEncodingError, match=_RX_ARRAY_IN_OBJECT):
         codec.encode(data)
 
 
 @pytest.mark.unit
-def test_encode_nested_arrays_in_deep_object_raises() -> None:
+def test_encode_nested_arrays_in_deep_object_raises(codec: ToonCodec) -> None:
     """Test that arrays deeply nested inside objects raise ToonEncodingError."""
-    codec = ToonCodec()
-
     data = {
         "level1": {
             "level2": {
@@ -120,15 +117,15 @@ def test_encode_nested_arrays_in_deep_object_raises() -> None:
         }
     }
 
-    with pytest.raises(ToonEncodingError, match="Arrays nested inside objects"):
+    with pytest.raises(ToonEncodingError, match=_RX_ARRAY_IN_OBJECT):
         codec.encode(data)
 
 
 @pytest.mark.unit
-def test_encode_table_with_nested_objects_in_rows() -> None:
+def test_encode_table_with_nested_objects_in_rows(
+    codec_expand: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test that nested objects in table rows are flattened into dotted columns."""
-    codec = ToonCodec(expand_paths=True)
-
     data = {
         "events": [
             {"ts": "2025-01-01", "user": {"id": 1, "name": "Alice"}},
@@ -136,18 +133,14 @@ def test_encode_table_with_nested_objects_in_rows() -> None:
         ]
     }
 
-    toon = codec.encode(data)
-    assert "events[2]{ts,user.id,user.name}:" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec_expand, data, contains=["events[2]{ts,user.id,user.name}:"])
 
 
 @pytest.mark.unit
-def test_encode_table_with_deep_nested_objects_in_rows() -> None:
+def test_encode_table_with_deep_nested_objects_in_rows(
+    codec_expand: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test that deeply nested objects in rows are flattened correctly."""
-    codec = ToonCodec(expand_paths=True)
-
     data = {
         "events": [
             {
@@ -157,19 +150,14 @@ def test_encode_table_with_deep_nested_objects_in_rows() -> None:
         ]
     }
 
-    toon = codec.encode(data)
-    assert "payload.sensor.type" in toon
-    assert "payload.sensor.location" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(
+        codec_expand, data, contains=["payload.sensor.type", "payload.sensor.location"]
+    )
 
 
 @pytest.mark.unit
-def test_encode_table_with_arrays_in_rows_raises() -> None:
+def test_encode_table_with_arrays_in_rows_raises(codec: ToonCodec) -> None:
     """Test that arrays inside table rows raise ToonEncodingError."""
-    codec = ToonCodec()
-
     data = {
         "events": [
             {
@@ -179,59 +167,52 @@ def test_encode_table_with_arrays_in_rows_raises() -> None:
         ]
     }
 
-    with pytest.raises(ToonEncodingError, match="Arrays nested inside tabular rows"):
+    with pytest.raises(ToonEncodingError, match=_RX_ARRAY_IN_ROW):
         codec.encode(data)
 
 
 @pytest.mark.unit
-def test_decode_path_conflict_scalar_vs_object_raises() -> None:
+def test_decode_path_conflict_scalar_vs_object_raises(codec_expand: ToonCodec) -> None:
     """Test that path conflict (scalar vs nested object) raises ToonDecodingError."""
-    codec = ToonCodec(expand_paths=True)
-
     # 'metadata' is set to a scalar, but we also need 'metadata.user'
     toon = """metadata: some_value
 metadata.user: another_value
 """
 
-    with pytest.raises(ToonDecodingError, match="conflict"):
-        codec.decode(toon)
+    with pytest.raises(ToonDecodingError, match=_RX_CONFLICT):
+        codec_expand.decode(toon)
 
 
 @pytest.mark.unit
-def test_decode_path_conflict_duplicate_key_raises() -> None:
+def test_decode_path_conflict_duplicate_key_raises(codec_expand: ToonCodec) -> None:
     """Test that duplicate keys raise ToonDecodingError."""
-    codec = ToonCodec(expand_paths=True)
-
     toon = """user.id: 1
 user.id: 2
 """
 
-    with pytest.raises(ToonDecodingError, match="already exists"):
-        codec.decode(toon)
+    with pytest.raises(ToonDecodingError, match=_RX_ALREADY):
+        codec_expand.decode(toon)
 
 
 @pytest.mark.unit
-def test_encode_mixed_nested_and_flat_keys() -> None:
+def test_encode_mixed_nested_and_flat_keys(
+    codec_expand: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test encoding data with both nested objects and top-level scalars."""
-    codec = ToonCodec(expand_paths=True)
-
     data = {
         "version": 1,
         "config": {"host": "localhost", "port": 5432},
         "enabled": True,
     }
 
-    toon = codec.encode(data)
-    decoded = codec.decode(toon)
-
-    assert decoded == data
+    assert_roundtrip(codec_expand, data)
 
 
 @pytest.mark.unit
-def test_roundtrip_preserves_structure_with_expand_paths() -> None:
+def test_roundtrip_preserves_structure_with_expand_paths(
+    codec_expand: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test complete round-trip with expand_paths=True preserves structure."""
-    codec = ToonCodec(expand_paths=True)
-
     data = {
         "app": {
             "name": "test-app",
@@ -240,22 +221,18 @@ def test_roundtrip_preserves_structure_with_expand_paths() -> None:
         }
     }
 
-    toon = codec.encode(data)
-    decoded = codec.decode(toon)
-
-    assert decoded == data
+    assert_roundtrip(codec_expand, data)
 
 
 @pytest.mark.unit
-def test_roundtrip_flat_keys_with_expand_paths_false() -> None:
+def test_roundtrip_flat_keys_with_expand_paths_false(
+    codec_expand: ToonCodec, codec_flat: ToonCodec
+) -> None:
     """Test round-trip with expand_paths=False keeps keys flat."""
-    codec_encode = ToonCodec(expand_paths=True)
-    codec_decode = ToonCodec(expand_paths=False)
-
     data = {"user": {"id": 123, "name": "Alice"}}
 
-    toon = codec_encode.encode(data)
-    decoded = codec_decode.decode(toon)
+    toon = codec_expand.encode(data)
+    decoded = codec_flat.decode(toon)
 
     # Should be flat
     assert decoded == {"user.id": 123, "user.name": "Alice"}
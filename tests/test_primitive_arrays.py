@@ -2,108 +2,52 @@
 Unit tests for primitive array encoding/decoding.
 """
 
+import re
+from typing import Any
+
 import pytest
 
 from pytoon_codec import ToonCodec, ToonDecodingError
+from tests._types import RoundTrip
+
+_RX_DECL5 = re.compile("declares length 5")
+_RX_DECL2 = re.compile("declares length 2")
+_RX_DECL0 = re.compile("declares length 0")
+
+PRIMITIVE_ROUNDTRIP_CASES = [
+    pytest.param({"tags": []}, ["tags[0]:"], id="empty"),
+    pytest.param(
+        {"tags": ["python", "toon", "llm"]},
+        ["tags[3]:", "python,toon,llm"],
+        id="strings",
+    ),
+    pytest.param({"numbers": [1, 2, 3, 4]}, ["numbers[4]:", "1,2,3,4"], id="ints"),
+    pytest.param({"values": [1.5, 2.7, 3.14]}, ["values[3]:"], id="floats"),
+    pytest.param(
+        {"flags": [True, False, True]}, ["flags[3]:", "true,false,true"], id="bools"
+    ),
+    pytest.param({"mixed": ["hello", 42, True, None]}, ["mixed[4]:"], id="mixed"),
+    pytest.param(
+        {"items": ["hello, world", "foo", "bar baz"]}, [], id="special-strings"
+    ),
+]
 
 
 @pytest.mark.unit
-def test_encode_decode_empty_primitive_array() -> None:
-    """Test empty arrays are encoded as key[0]:"""
-    codec = ToonCodec()
-    data = {"tags": []}
-
-    toon = codec.encode(data)
-    assert "tags[0]:" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == {"tags": []}
-
-
-@pytest.mark.unit
-def test_encode_decode_primitive_string_array() -> None:
-    """Test array of strings is encoded inline with commas."""
-    codec = ToonCodec()
-    data = {"tags": ["python", "toon", "llm"]}
-
-    toon = codec.encode(data)
-    assert "tags[3]:" in toon
-    assert "python,toon,llm" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
-
-
-@pytest.mark.unit
-def test_encode_decode_primitive_int_array() -> None:
-    """Test array of integers is encoded correctly."""
-    codec = ToonCodec()
-    data = {"numbers": [1, 2, 3, 4]}
-
-    toon = codec.encode(data)
-    assert "numbers[4]:" in toon
-    assert "1,2,3,4" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
-
-
-@pytest.mark.unit
-def test_encode_decode_primitive_float_array() -> None:
-    """Test array of floats is encoded correctly."""
-    codec = ToonCodec()
-    data = {"values": [1.5, 2.7, 3.14]}
-
-    toon = codec.encode(data)
-    assert "values[3]:" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
-
-
-@pytest.mark.unit
-def test_encode_decode_primitive_bool_array() -> None:
-    """Test array of booleans is encoded as true/false."""
-    codec = ToonCodec()
-    data = {"flags": [True, False, True]}
-
-    toon = codec.encode(data)
-    assert "flags[3]:" in toon
-    assert "true,false,true" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+@pytest.mark.parametrize(("data", "contains"), PRIMITIVE_ROUNDTRIP_CASES)
+def test_encode_decode_primitive_array_roundtrip(
+    codec: ToonCodec,
+    assert_roundtrip: RoundTrip,
+    data: dict[str, Any],
+    contains: list[str],
+) -> None:
+    """Test primitive arrays encode inline and decode back unchanged."""
+    assert_roundtrip(codec, data, contains=contains)
 
 
 @pytest.mark.unit
-def test_encode_decode_primitive_mixed_types_array() -> None:
-    """Test array with mixed primitive types (str, int, bool, None)."""
-    codec = ToonCodec()
-    data = {"mixed": ["hello", 42, True, None]}
-
-    toon = codec.encode(data)
-    assert "mixed[4]:" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
-
-
-@pytest.mark.unit
-def test_encode_primitive_array_with_special_strings() -> None:
-    """Test array containing strings that need quoting."""
-    codec = ToonCodec()
-    data = {"items": ["hello, world", "foo", "bar baz"]}
-
-    toon = codec.encode(data)
-
-    decoded = codec.decode(toon)
-    assert decoded == data
-
-
-@pytest.mark.unit
-def test_decode_primitive_array_single_item() -> None:
+def test_decode_primitive_array_single_item(codec: ToonCodec) -> None:
     """Test decoding array with single item."""
-    codec = ToonCodec()
     toon = "tags[1]: foo"
 
     decoded = codec.decode(toon)
@@ -111,9 +55,8 @@ def test_decode_primitive_array_single_item() -> None:
 
 
 @pytest.mark.unit
-def test_decode_primitive_array_empty() -> None:
+def test_decode_primitive_array_empty(codec: ToonCodec) -> None:
     """Test decoding empty array."""
-    codec = ToonCodec()
     toon = "tags[0]:"
 
     decoded = codec.decode(toon)
@@ -121,9 +64,8 @@ def test_decode_primitive_array_empty() -> None:
 
 
 @pytest.mark.unit
-def test_decode_primitive_array_with_whitespace() -> None:
+def test_decode_primitive_array_with_whitespace(codec: ToonCodec) -> None:
     """Test decoding handles extra whitespace gracefully."""
-    codec = ToonCodec()
     toon = "tags[3]:  foo , bar , baz  "
 
     decoded = codec.decode(toon)
@@ -132,50 +74,59 @@ def test_decode_primitive_array_with_whitespace() -> None:
 
 
 @pytest.mark.unit
-def test_decode_primitive_array_length_mismatch_too_few_raises() -> None:
-    """Test that declaring more items than provided raises ToonDecodingError."""
-    codec = ToonCodec()
-    bad_toon = "tags[5]: a,b,c"  # declares 5, only 3 values
-
-    with pytest.raises(ToonDecodingError, match="declares length 5"):
+@pytest.mark.parametrize(
+    ("bad_toon", "match"),
+    [
+        pytest.param("tags[5]: a,b,c", _RX_DECL5, id="too-few"),
+        pytest.param("tags[2]: a,b,c,d", _RX_DECL2, id="too-many"),
+        pytest.param("tags[0]: a,b", _RX_DECL0, id="zero-with-values"),
+    ],
+)
+def test_decode_primitive_array_length_mismatch_raises(
+    codec: ToonCodec, bad_toon: str, match: re.Pattern[str]
+) -> None:
+    """Test that a declared length that disagrees with the values raises."""
+    with pytest.raises(ToonDecodingError, match=match):
         codec.decode(bad_toon)
 
 
 @pytest.mark.unit
-def test_decode_primitive_array_length_mismatch_too_many_raises() -> None:
-    """Test that providing more items than declared raises ToonDecodingError."""
-    codec = ToonCodec()
-    bad_toon = "tags[2]: a,b,c,d"  # declares 2, but 4 values
+def test_decode_primitive_array_type_inference(codec: ToonCodec) -> None:
+    """Test that type inference works correctly for array values."""
+    toon = "data[6]: 42,3.14,true,false,null,hello"
 
-    with pytest.raises(ToonDecodingError, match="declares length 2"):
-        codec.decode(bad_toon)
+    decoded = codec.decode(toon)
+    assert decoded == {"data": [42, 3.14, True, False, None, "hello"]}
 
 
 @pytest.mark.unit
-def test_decode_primitive_array_zero_length_with_values_raises() -> None:
-    """Test that empty array declaration with values raises error."""
-    codec = ToonCodec()
-    bad_toon = "tags[0]: a,b"  # declares 0 but has values
+def test_decode_primitive_array_quoted_strings(codec: ToonCodec) -> None:
+    """Test decoding array with JSON-quoted strings."""
+    toon = 'items[2]: "hello, world","foo"'
 
-    with pytest.raises(ToonDecodingError):
-        codec.decode(bad_toon)
+    decoded = codec.decode(toon)
+    assert decoded == {"items": ["hello, world", "foo"]}
 
 
 @pytest.mark.unit
-def test_decode_primitive_array_type_inference() -> None:
-    """Test that type inference works correctly for array values."""
-    codec = ToonCodec()
-    toon = "data[6]: 42,3.14,true,false,null,hello"
+def test_decode_primitive_array_unquoted_backslashes_are_literal(
+    codec: ToonCodec,
+) -> None:
+    """Test that backslashes outside quotes are kept verbatim."""
+    toon = "paths[2]: C:\\temp,a\\b"
 
     decoded = codec.decode(toon)
-    assert decoded == {"data": [42, 3.14, True, False, None, "hello"]}
+    assert decoded == {"paths": ["C:\\temp", "a\\b"]}
 
 
 @pytest.mark.unit
-def test_decode_primitive_array_quoted_strings() -> None:
-    """Test decoding array with JSON-quoted strings."""
-    codec = ToonCodec()
-    toon = 'items[2]: "hello, world","foo"'
+def test_encode_numeric_array_formats_like_scalars(codec: ToonCodec) -> None:
+    """Test that int/float arrays keep the scalar number formatting."""
+    data = {"series": [1, -0.0, 2.5, 1e-07, 10**20], "flags": [1, True, 0.5]}
 
-    decoded = codec.decode(toon)
-    assert decoded == {"items": ["hello, world", "foo"]}
+    toon = codec.encode(data)
+    assert (
+        toon
+        == "series[5]: 1,-0.0,2.5,1e-07,100000000000000000000\n\nflags[3]: 1,true,0.5"
+    )
+    assert codec.decode(toon) == data
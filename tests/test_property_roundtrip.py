@@ -0,0 +1,48 @@
+"""
+Property-based round-trip tests (skipped when Hypothesis is not installed).
+
+Failing examples are saved to Hypothesis' example database under
+``.hypothesis/`` and replayed first on the next run, so a found regression
+is re-checked immediately instead of being searched for again.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pytoon_codec import ToonCodec
+
+hypothesis = pytest.importorskip("hypothesis")
+st = pytest.importorskip("hypothesis.strategies")
+
+# Keys the line grammar accepts without dotted-path expansion
+KEYS = st.from_regex(r"[A-Za-z_][A-Za-z0-9_]{0,7}", fullmatch=True)
+
+
+def _decodes_as_string(value: str) -> bool:
+    """Return False for strings TOON reads back as a literal or a number."""
+    if value.strip() in ("true", "false", "null"):
+        return False
+    try:
+        float(value)
+    except ValueError:
+        return True
+    return False
+
+
+PRIMITIVES = st.one_of(
+    st.integers(min_value=-(10**18), max_value=10**18),
+    st.floats(allow_nan=False),
+    st.text().filter(_decodes_as_string),
+    st.booleans(),
+    st.none(),
+)
+
+
+@pytest.mark.unit
+@hypothesis.given(st.dictionaries(KEYS, PRIMITIVES))
+def test_property_scalar_mapping_roundtrip(
+    codec: ToonCodec, data: dict[str, object]
+) -> None:
+    """Any mapping of scalar fields decodes back to itself."""
+    assert codec.decode(codec.encode(data)) == data
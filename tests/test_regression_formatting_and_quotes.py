@@ -7,6 +7,7 @@ These tests ensure specific edge cases and bugs that were fixed remain fixed.
 import pytest
 
 from pytoon_codec import ToonCodec
+from tests._types import RoundTrip
 
 
 @pytest.mark.regression
@@ -159,14 +160,14 @@ def test_regression_boolean_string_vs_boolean() -> None:
 
 
 @pytest.mark.regression
-def test_regression_table_cell_with_quote_and_comma() -> None:
+def test_regression_table_cell_with_quote_and_comma(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """
     Regression: Table cells with both quotes and commas must be properly escaped.
 
     Bug: Complex escaping scenarios weren't handled correctly.
     """
-    codec = ToonCodec()
-
     data = {
         "items": [
             {"id": 1, "desc": 'Product: "Best, #1"'},
@@ -174,24 +175,63 @@ def test_regression_table_cell_with_quote_and_comma() -> None:
         ]
     }
 
-    toon = codec.encode(data)
-    decoded = codec.decode(toon)
-
-    assert decoded == data
+    assert_roundtrip(codec, data)
 
 
 @pytest.mark.regression
-def test_regression_unicode_characters_preserved() -> None:
+def test_regression_unicode_characters_preserved(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """
     Regression: Ensure Unicode characters are preserved correctly.
 
     Bug: Non-ASCII characters were sometimes corrupted or lost.
     """
-    codec = ToonCodec()
-
     data = {"message": "Hello 世界 🌍", "emoji": "😀👍", "accents": "café résumé"}
 
-    toon = codec.encode(data)
-    decoded = codec.decode(toon)
+    assert_roundtrip(codec, data)
 
-    assert decoded == data
+
+@pytest.mark.regression
+def test_regression_quoted_unicode_is_not_ascii_escaped(codec: ToonCodec) -> None:
+    """
+    Regression: Quoted strings keep non-ASCII characters literal.
+
+    Bug guard: escaping them as \\uXXXX (ensure_ascii-style) would round-trip
+    but inflate the token count of every quoted non-ASCII cell.
+    """
+    toon = codec.encode({"note": "café, 世界"})
+
+    assert toon == 'note: "café, 世界"'
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("plain", "plain"),
+        ("a:b", "a:b"),
+        ("two words", "two words"),
+        ("back\\slash", "back\\slash"),
+        ("", '""'),
+        ("a,b", '"a,b"'),
+        ('say "hi"', '"say \\"hi\\""'),
+        ("line\nbreak", '"line\\nbreak"'),
+        ("carriage\rreturn", '"carriage\\rreturn"'),
+        (" lead", '" lead"'),
+        ("trail\t", '"trail\\t"'),
+        ("\u2003wide", '"\u2003wide"'),
+    ],
+)
+def test_regression_string_quoting_triggers(value: str, expected: str) -> None:
+    """
+    Regression: Pin exactly which strings are quoted by the encoder.
+
+    Bug guard: Rewrites of the quoting check must keep treating any Unicode
+    whitespace at either end as significant, and must not quote colons.
+    """
+    codec = ToonCodec()
+
+    toon = codec.encode({"s": value})
+    assert toon == f"s: {expected}"
+    assert codec.decode(toon) == {"s": value}
@@ -209,6 +209,42 @@ def test_regression_mixed_line_endings() -> None:
     assert decoded == {"version": 1, "name": "test", "tags": ["a", "b"]}
 
 
+@pytest.mark.regression
+def test_regression_cr_only_line_endings() -> None:
+    """
+    Regression: Classic Mac line endings (lone \\r) should end lines.
+
+    Bug: Only \\r\\n was normalized, so a lone \\r stayed inside the value
+    and the following lines were swallowed into it.
+    """
+    codec = ToonCodec()
+
+    toon = "version: 1\rname: test\rtags[2]: a,b\r"
+
+    decoded = codec.decode(toon)
+
+    assert decoded == {"version": 1, "name": "test", "tags": ["a", "b"]}
+
+
+@pytest.mark.regression
+def test_regression_cr_only_line_endings_in_table() -> None:
+    """
+    Regression: Table bodies with lone \\r line endings should decode.
+
+    Bug: The whole table was read as one line and raised "Invalid scalar line".
+    """
+    codec = ToonCodec()
+
+    toon = "rows[2]{id,name}:\r  1,a\r  2,b\r\r\ndone: true\n"
+
+    decoded = codec.decode(toon)
+
+    assert decoded == {
+        "rows": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+        "done": True,
+    }
+
+
 @pytest.mark.regression
 def test_regression_preserve_internal_whitespace_in_values() -> None:
     """
@@ -226,3 +262,44 @@ def test_regression_preserve_internal_whitespace_in_values() -> None:
 
     # Should preserve the space between first and last name
     assert decoded["name"] == "Alice Smith"
+
+
+@pytest.mark.regression
+def test_regression_unicode_line_boundaries_in_values_roundtrip() -> None:
+    """
+    Regression: Values containing non-newline line boundaries must roundtrip.
+
+    Bug: Decoding split lines on every Unicode line boundary (e.g. form feed
+    or U+2028), breaking values the encoder legitimately left unquoted.
+    """
+    codec = ToonCodec()
+
+    data = {
+        "page": "one\x0ctwo",
+        "para": "first\u2028second",
+        "rows": [{"note": "a\x1cb"}],
+    }
+
+    decoded = codec.decode(codec.encode(data))
+
+    assert decoded == data
+
+
+@pytest.mark.regression
+def test_regression_windows_line_endings_in_table() -> None:
+    """
+    Regression: CRLF line endings must not leak into table cells.
+
+    Bug guard: Table bodies are read line by line and need the same
+    trailing \\r handling as scalar lines.
+    """
+    codec = ToonCodec()
+
+    toon = "rows[2]{id,name}:\r\n  1,a\r\n  2,b\r\ndone: true\r\n"
+
+    decoded = codec.decode(toon)
+
+    assert decoded == {
+        "rows": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+        "done": True,
+    }
@@ -5,13 +5,14 @@ Unit tests for scalar encoding/decoding and primitive values.
 import pytest
 
 from pytoon_codec import ToonCodec, ToonDecodingError
+from tests._types import RoundTrip
 
 
 @pytest.mark.unit
-def test_encode_decode_simple_scalars() -> None:
+def test_encode_decode_simple_scalars(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test basic scalar types round-trip correctly."""
-    codec = ToonCodec()
-
     data = {
         "flag": True,
         "count": 42,
@@ -20,10 +21,7 @@ def test_encode_decode_simple_scalars() -> None:
         "empty": None,
     }
 
-    toon = codec.encode(data)
-    decoded = codec.decode(toon)
-
-    assert decoded == data
+    assert_roundtrip(codec, data)
 
 
 @pytest.mark.unit
@@ -90,27 +88,23 @@ def test_encode_scalar_simple_string() -> None:
 
 
 @pytest.mark.unit
-def test_encode_scalar_with_comma_uses_quotes() -> None:
+def test_encode_scalar_with_comma_uses_quotes(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test strings containing commas are JSON-quoted."""
-    codec = ToonCodec()
     data = {"text": "hello, world"}
-    toon = codec.encode(data)
-    assert 'text: "hello, world"' in toon
 
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data, contains=['text: "hello, world"'])
 
 
 @pytest.mark.unit
-def test_encode_scalar_with_trailing_spaces_uses_quotes() -> None:
+def test_encode_scalar_with_trailing_spaces_uses_quotes(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test strings with leading/trailing spaces are JSON-quoted."""
-    codec = ToonCodec()
     data = {"text": "  hello  "}
-    toon = codec.encode(data)
-    assert '"  hello  "' in toon
 
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data, contains=['"  hello  "'])
 
 
 @pytest.mark.unit
@@ -127,14 +121,13 @@ def test_encode_scalar_with_newline_uses_quotes() -> None:
 
 
 @pytest.mark.unit
-def test_encode_scalar_with_quote_uses_quotes() -> None:
+def test_encode_scalar_with_quote_uses_quotes(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test strings containing quotes are JSON-quoted and escaped."""
-    codec = ToonCodec()
     data = {"text": 'say "hello"'}
-    toon = codec.encode(data)
 
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data)
 
 
 @pytest.mark.unit
@@ -230,3 +223,50 @@ key: value
 """
     decoded = codec.decode(toon)
     assert decoded == {"key": "value"}
+
+
+@pytest.mark.unit
+def test_decode_scalar_number_detection_by_leading_character() -> None:
+    """Test numeric inference for signed, fractional and special-float cells."""
+    codec = ToonCodec()
+    toon = "a: -7\nb: .5\nc: inf\nd: sensor-1\ne: 2024-01-01"
+    decoded = codec.decode(toon)
+    assert decoded == {
+        "a": -7,
+        "b": 0.5,
+        "c": float("inf"),
+        "d": "sensor-1",
+        "e": "2024-01-01",
+    }
+
+
+@pytest.mark.unit
+def test_decode_scalar_number_spellings_outside_plain_decimal() -> None:
+    """Test int()/float() spellings that the numeric regex does not cover."""
+    codec = ToonCodec()
+    toon = "a: 1_000\nb: -Infinity\nc: 1.5E+3\nd: 5.\ne: 1e\nf: ١٢"
+    decoded = codec.decode(toon)
+    assert decoded == {
+        "a": 1000,
+        "b": float("-inf"),
+        "c": 1500.0,
+        "d": 5.0,
+        "e": "1e",
+        "f": 12,
+    }
+
+
+@pytest.mark.unit
+def test_encode_primitive_subclasses_use_base_formatting() -> None:
+    """Test that int/str subclasses format like their base types."""
+    from enum import IntEnum
+
+    class Level(IntEnum):
+        HIGH = 3
+
+    class Label(str):
+        pass
+
+    codec = ToonCodec()
+    toon = codec.encode({"level": Level.HIGH, "label": Label("a, b")})
+    assert toon == 'level: 3\n\nlabel: "a, b"'
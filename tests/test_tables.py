@@ -2,16 +2,19 @@
 Unit tests for tabular array encoding/decoding.
 """
 
+from enum import IntEnum
+
 import pytest
 
 from pytoon_codec import ToonCodec, ToonDecodingError, ToonEncodingError
+from tests._types import RoundTrip
 
 
 @pytest.mark.unit
-def test_encode_decode_simple_table() -> None:
+def test_encode_decode_simple_table(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test basic tabular encoding with two rows."""
-    codec = ToonCodec()
-
     data = {
         "metrics": [
             {"date": "2025-01-01", "value": 100},
@@ -19,32 +22,24 @@ def test_encode_decode_simple_table() -> None:
         ]
     }
 
-    toon = codec.encode(data)
-    assert "metrics[2]{date,value}:" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data, contains=["metrics[2]{date,value}:"])
 
 
 @pytest.mark.unit
-def test_encode_decode_table_single_row() -> None:
+def test_encode_decode_table_single_row(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test table with a single row."""
-    codec = ToonCodec()
-
     data = {"users": [{"id": 1, "name": "Alice"}]}
 
-    toon = codec.encode(data)
-    assert "users[1]{id,name}:" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data, contains=["users[1]{id,name}:"])
 
 
 @pytest.mark.unit
-def test_encode_decode_table_multiple_columns() -> None:
+def test_encode_decode_table_multiple_columns(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test table with many columns."""
-    codec = ToonCodec()
-
     data = {
         "readings": [
             {
@@ -62,17 +57,14 @@ def test_encode_decode_table_multiple_columns() -> None:
         ]
     }
 
-    toon = codec.encode(data)
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data)
 
 
 @pytest.mark.unit
-def test_encode_decode_table_with_null_values() -> None:
+def test_encode_decode_table_with_null_values(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test table containing null values."""
-    codec = ToonCodec()
-
     data = {
         "events": [
             {"ts": "2025-01-01", "error": None},
@@ -80,18 +72,14 @@ def test_encode_decode_table_with_null_values() -> None:
         ]
     }
 
-    toon = codec.encode(data)
-    assert "null" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data, contains=["null"])
 
 
 @pytest.mark.unit
-def test_encode_decode_table_with_bool_values() -> None:
+def test_encode_decode_table_with_bool_values(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test table with boolean columns."""
-    codec = ToonCodec()
-
     data = {
         "flags": [
             {"name": "feature_a", "enabled": True},
@@ -99,30 +87,22 @@ def test_encode_decode_table_with_bool_values() -> None:
         ]
     }
 
-    toon = codec.encode(data)
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data)
 
 
 @pytest.mark.unit
-def test_encode_decode_empty_table() -> None:
+def test_encode_decode_empty_table(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test that empty array of objects is encoded as [0]{}: with no columns."""
-    codec = ToonCodec()
     data = {"items": []}
 
-    toon = codec.encode(data)
-    assert "items[0]:" in toon
-
-    decoded = codec.decode(toon)
-    assert decoded == data
+    assert_roundtrip(codec, data, contains=["items[0]:"])
 
 
 @pytest.mark.unit
-def test_encode_table_inconsistent_row_fields_raises() -> None:
+def test_encode_table_inconsistent_row_fields_raises(codec: ToonCodec) -> None:
     """Test that rows with different field sets raise ToonEncodingError."""
-    codec = ToonCodec()
-
     data = {
         "metrics": [
             {"date": "2025-01-01", "value": 1},
@@ -135,10 +115,8 @@ def test_encode_table_inconsistent_row_fields_raises() -> None:
 
 
 @pytest.mark.unit
-def test_encode_table_extra_field_in_second_row_raises() -> None:
+def test_encode_table_extra_field_in_second_row_raises(codec: ToonCodec) -> None:
     """Test that extra fields in later rows raise ToonEncodingError."""
-    codec = ToonCodec()
-
     data = {
         "metrics": [
             {"date": "2025-01-01", "value": 1},
@@ -151,10 +129,8 @@ def test_encode_table_extra_field_in_second_row_raises() -> None:
 
 
 @pytest.mark.unit
-def test_decode_table_row_column_count_mismatch_raises() -> None:
+def test_decode_table_row_column_count_mismatch_raises(codec: ToonCodec) -> None:
     """Test that row with wrong number of cells raises ToonDecodingError."""
-    codec = ToonCodec()
-
     toon = """metrics[2]{date,value}:
   2025-01-01,100
   2025-01-02"""  # missing value cell
@@ -164,10 +140,24 @@ def test_decode_table_row_column_count_mismatch_raises() -> None:
 
 
 @pytest.mark.unit
-def test_decode_table_row_count_mismatch_too_few_raises() -> None:
-    """Test that fewer rows than declared raises ToonDecodingError."""
-    codec = ToonCodec()
+@pytest.mark.parametrize("blank", ["", "   "])
+def test_decode_table_cell_count_error_reports_data_row_index(
+    blank: str, codec: ToonCodec
+) -> None:
+    """Test that blank body lines, empty or not, are not counted as rows."""
+    toon = (
+        f"metrics[3]{{date,value}}:\n  2025-01-01,1\n{blank}\n  2025-01-02,2,3\n  x,3"
+    )
+
+    with pytest.raises(ToonDecodingError, match=r"Row 1 in table 'metrics' has 3"):
+        codec.decode(toon)
+    with pytest.raises(ToonDecodingError, match=r"Row 1 in table 'metrics' has 3"):
+        list(codec.iter_table(toon, chunk_size=1))
+
 
+@pytest.mark.unit
+def test_decode_table_row_count_mismatch_too_few_raises(codec: ToonCodec) -> None:
+    """Test that fewer rows than declared raises ToonDecodingError."""
     toon = """metrics[3]{date,value}:
   2025-01-01,100
   2025-01-02,120"""  # declares 3 rows, only 2 provided
@@ -177,10 +167,8 @@ def test_decode_table_row_count_mismatch_too_few_raises() -> None:
 
 
 @pytest.mark.unit
-def test_decode_table_row_count_mismatch_too_many_raises() -> None:
+def test_decode_table_row_count_mismatch_too_many_raises(codec: ToonCodec) -> None:
     """Test that more rows than declared raises ToonDecodingError."""
-    codec = ToonCodec()
-
     toon = """metrics[1]{date,value}:
   2025-01-01,100
   2025-01-02,120"""  # declares 1 row, but 2 provided
@@ -190,10 +178,8 @@ def test_decode_table_row_count_mismatch_too_many_raises() -> None:
 
 
 @pytest.mark.unit
-def test_decode_table_with_no_fields_raises() -> None:
+def test_decode_table_with_no_fields_raises(codec: ToonCodec) -> None:
     """Test that table header with no fields raises ToonDecodingError."""
-    codec = ToonCodec()
-
     toon = """metrics[2]{}:
   2025-01-01,100
   2025-01-02,120"""
@@ -203,10 +189,8 @@ def test_decode_table_with_no_fields_raises() -> None:
 
 
 @pytest.mark.unit
-def test_decode_table_invalid_header_syntax_raises() -> None:
+def test_decode_table_invalid_header_syntax_raises(codec: ToonCodec) -> None:
     """Test that malformed table header raises ToonDecodingError."""
-    codec = ToonCodec()
-
     # Missing closing brace
     toon = """metrics[2]{date,value:
   2025-01-01,100"""
@@ -216,10 +200,8 @@ def test_decode_table_invalid_header_syntax_raises() -> None:
 
 
 @pytest.mark.unit
-def test_decode_table_preserves_column_order() -> None:
+def test_decode_table_preserves_column_order(codec: ToonCodec) -> None:
     """Test that column order is preserved during round-trip."""
-    codec = ToonCodec()
-
     toon = """items[2]{id,name,active}:
   1,Alice,true
   2,Bob,false"""
@@ -233,10 +215,10 @@ def test_decode_table_preserves_column_order() -> None:
 
 
 @pytest.mark.unit
-def test_encode_table_with_special_characters_in_cells() -> None:
+def test_encode_table_with_special_characters_in_cells(
+    codec: ToonCodec, assert_roundtrip: RoundTrip
+) -> None:
     """Test that cells with commas or quotes are properly escaped."""
-    codec = ToonCodec()
-
     data = {
         "events": [
             {"id": 1, "msg": "hello, world"},
@@ -244,17 +226,12 @@ def test_encode_table_with_special_characters_in_cells() -> None:
         ]
     }
 
-    toon = codec.encode(data)
-    decoded = codec.decode(toon)
-
-    assert decoded == data
+    assert_roundtrip(codec, data)
 
 
 @pytest.mark.unit
-def test_decode_table_type_inference_in_cells() -> None:
+def test_decode_table_type_inference_in_cells(codec: ToonCodec) -> None:
     """Test that cell values are correctly typed (int, float, bool, null, str)."""
-    codec = ToonCodec()
-
     toon = """data[2]{id,ratio,active,error,name}:
   1,3.14,true,null,Alice
   2,2.71,false,null,Bob"""
@@ -267,3 +244,237 @@ def test_decode_table_type_inference_in_cells() -> None:
             {"id": 2, "ratio": 2.71, "active": False, "error": None, "name": "Bob"},
         ]
     }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("repeat", [1, 8])
+def test_decode_table_mixed_columns_infer_types_per_cell(
+    repeat: int, codec: ToonCodec
+) -> None:
+    """Test that a column mixing types is still inferred cell by cell."""
+    cells = ["7", "1.0", "null", '"7"']
+    body = [f"  {i},{cells[i % 4]}" for i in range(4 * repeat)]
+    toon = "\n".join([f"data[{4 * repeat}]{{n,v}}:", *body])
+
+    decoded = codec.decode(toon)
+
+    values = [row["v"] for row in decoded["data"]]
+    assert values == [7, 1.0, None, "7"] * repeat
+    assert [type(v) for v in values] == [int, float, type(None), str] * repeat
+    assert [row["n"] for row in decoded["data"]] == list(range(4 * repeat))
+
+
+@pytest.mark.unit
+def test_encode_table_rows_with_different_key_order(codec: ToonCodec) -> None:
+    """Test that cells follow the header order even if row keys are reordered."""
+    data = {"points": [{"x": 1, "y": 2}, {"y": 4, "x": 3}]}
+
+    toon = codec.encode(data)
+    assert toon == "points[2]{x,y}:\n  1,2\n  3,4"
+
+
+@pytest.mark.unit
+def test_encode_decode_single_column_table(codec: ToonCodec) -> None:
+    """Test table with exactly one column."""
+    data = {"ids": [{"id": 1}, {"id": 2}]}
+
+    toon = codec.encode(data)
+    assert toon == "ids[2]{id}:\n  1\n  2"
+    assert codec.decode(toon) == data
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pretty_tables", [False, True])
+def test_encode_large_table_matches_row_by_row_layout(
+    pretty_tables: bool, codec: ToonCodec
+) -> None:
+    """Test that large tables keep the same line layout as small ones."""
+    rows = [{"id": i, "label": f"row {i}", "ok": i % 2 == 0} for i in range(300)]
+    toon = codec.encode({"rows": rows}, pretty_tables=pretty_tables)
+
+    indent = "    " if pretty_tables else "  "
+    expected_body = [
+        f"{indent}{i},row {i},{'true' if i % 2 == 0 else 'false'}" for i in range(300)
+    ]
+    header = "  rows[300]{id,label,ok}:" if pretty_tables else "rows[300]{id,label,ok}:"
+    assert toon.split("\n") == [header, *expected_body]
+    assert codec.decode(toon) == {"rows": rows}
+
+
+@pytest.mark.unit
+def test_encode_wide_table_matches_single_row_formatting(codec: ToonCodec) -> None:
+    """Test that column-wise formatting of big tables matches per-row output."""
+    rows = [
+        {
+            "id": i,
+            "score": i / 4,
+            "ok": i % 3 == 0,
+            "label": f"item {i}" if i % 5 else f"item, {i}",
+            "maybe": None if i % 2 else i,
+        }
+        for i in range(1000)
+    ]
+    toon = codec.encode({"t": rows})
+
+    expected_body = [codec.encode({"t": [row]}).split("\n")[1] for row in rows]
+    assert toon.split("\n")[1:] == expected_body
+    assert codec.decode(toon) == {"t": rows}
+
+
+@pytest.mark.unit
+def test_encode_wide_table_string_column_quotes_edge_cells(codec: ToonCodec) -> None:
+    """Test that delimiter-free string columns still quote empty/padded cells."""
+    labels = ["plain", "", " padded", "tail ", "café"]
+    rows = [
+        {"id": i, "a": labels[i % 5], "b": "x", "c": "y", "d": "z"} for i in range(1000)
+    ]
+    toon = codec.encode({"t": rows})
+
+    expected_body = [codec.encode({"t": [row]}).split("\n")[1] for row in rows]
+    assert toon.split("\n")[1:] == expected_body
+    assert '1,"",x,y,z' in toon
+    assert codec.decode(toon) == {"t": rows}
+
+
+@pytest.mark.unit
+def test_decode_repeated_table_header_reuses_column_names(codec: ToonCodec) -> None:
+    """Test that decoding the same header twice yields shared column-name keys."""
+    first = codec.decode("t[1]{ date , value }:\n  2025-01-01,1")
+    second = codec.decode("t[1]{ date , value }:\n  2025-01-02,2")
+
+    assert first == {"t": [{"date": "2025-01-01", "value": 1}]}
+    first_keys = list(first["t"][0])
+    second_keys = list(second["t"][0])
+    assert all(a is b for a, b in zip(first_keys, second_keys, strict=True))
+
+
+@pytest.mark.unit
+def test_encode_table_rows_with_differing_cell_types(codec: ToonCodec) -> None:
+    """Test rows whose cell types differ (nulls, bools, subclasses) per row."""
+
+    class Level(IntEnum):
+        HIGH = 3
+
+    rows = [
+        {"id": 1, "score": 0.5, "ok": True, "tag": "a"},
+        {"id": None, "score": 2, "ok": False, "tag": "b, c"},
+        {"id": Level.HIGH, "score": None, "ok": None, "tag": ""},
+    ]
+
+    toon = codec.encode({"t": rows})
+
+    assert toon.split("\n")[1:] == [
+        "  1,0.5,true,a",
+        '  null,2,false,"b, c"',
+        '  3,null,null,""',
+    ]
+
+
+@pytest.mark.unit
+def test_encode_sparse_table_compiles_one_row_formatter(codec: ToonCodec) -> None:
+    """Test that nullable, mixed-type columns do not compile a formatter per row."""
+    from pytoon_codec.pytoon_codec import _ROW_FORMATTER_CACHE
+
+    cells = [None, 1, "a, b", None, 2.5, True, None]
+    rows = [
+        {f"c{col}": cells[(row * (col + 1)) % len(cells)] for col in range(10)}
+        for row in range(300)
+    ]
+    _ROW_FORMATTER_CACHE.clear()
+
+    toon = codec.encode({"t": rows})
+
+    assert len(_ROW_FORMATTER_CACHE) == 1
+    expected_body = [codec.encode({"t": [row]}).split("\n")[1] for row in rows]
+    assert toon.split("\n")[1:] == expected_body
+    assert codec.decode(toon) == {"t": rows}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("n_rows", [2, 20])
+def test_decode_columnar_mode_returns_column_lists(
+    n_rows: int, codec: ToonCodec, codec_columnar: ToonCodec
+) -> None:
+    """Test that decode_mode='columnar' yields one value list per column."""
+    rows = [
+        {"date": f"2025-01-{i + 1:02d}", "value": i, "user.id": None if i else 1.5}
+        for i in range(n_rows)
+    ]
+
+    decoded = codec_columnar.decode(codec.encode({"t": rows, "name": "x"}))
+
+    assert decoded == {
+        "t": {field: [row[field] for row in rows] for field in rows[0]},
+        "name": "x",
+    }
+
+
+@pytest.mark.unit
+def test_decode_columnar_mode_empty_table_and_row_count_check(
+    codec_columnar: ToonCodec,
+) -> None:
+    """Test columnar decoding of empty tables and declared row counts."""
+    assert codec_columnar.decode("t[0]{a,b}:") == {"t": {"a": [], "b": []}}
+    with pytest.raises(ToonDecodingError, match="declares 2 rows"):
+        codec_columnar.decode("t[2]{a,b}:\n  1,2")
+
+
+@pytest.mark.unit
+def test_invalid_decode_mode_raises() -> None:
+    """Test that an unknown decode_mode is rejected at construction."""
+    with pytest.raises(ValueError, match="decode_mode"):
+        ToonCodec(decode_mode="arrays")  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 3, 4, 100])
+def test_iter_table_chunks_concatenate_to_columnar_decode(
+    chunk_size: int, codec: ToonCodec, codec_columnar: ToonCodec
+) -> None:
+    """Test that iter_table chunks add up to the columnar decode of each table."""
+    rows = [{"id": i, "user": {"name": f"u{i}"}, "ok": i % 2 == 0} for i in range(10)]
+    toon = codec.encode({"title": "x", "a": rows, "b": [1, 2], "c": rows[:2]})
+    columnar = codec_columnar.decode(toon)
+
+    chunks = list(codec.iter_table(toon, chunk_size=chunk_size))
+
+    merged: dict[str, dict[str, list[object]]] = {}
+    for name, chunk in chunks:
+        assert all(len(values) <= chunk_size for values in chunk.values())
+        columns = merged.setdefault(name, {field: [] for field in chunk})
+        for field, values in chunk.items():
+            columns[field].extend(values)
+    assert merged == {name: columnar[name] for name in ("a", "c")}
+
+
+@pytest.mark.unit
+def test_iter_table_empty_table_and_row_errors_like_decode(codec: ToonCodec) -> None:
+    """Test empty tables and that chunking keeps decode()'s row numbers and counts."""
+    too_many = "t[2]{a}:\n  1\n  2\n  3\n  4\n  5"
+    bad_row = "t[4]{a}:\n  1\n  2\n  3\n  x,1"
+
+    with pytest.raises(ToonDecodingError, match="declares 2 rows, but 5 rows"):
+        list(codec.iter_table(too_many, chunk_size=2))
+    with pytest.raises(ToonDecodingError, match="Row 3 in table 't' has 2 cells"):
+        list(codec.iter_table(bad_row, chunk_size=2))
+    assert list(codec.iter_table("t[0]{a,b}:")) == [("t", {"a": [], "b": []})]
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(codec.iter_table(too_many, chunk_size=0))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("n_rows", [2, 20])
+def test_decode_table_with_non_identifier_column_names(
+    n_rows: int, codec_flat: ToonCodec
+) -> None:
+    """Test that row building handles column names that are not identifiers."""
+    body = "\n".join(f"  {i},{i + 1},{i + 2},{i + 3},{i + 4}" for i in range(n_rows))
+
+    decoded = codec_flat.decode(f't[{n_rows}]{{a b,"q",x-y,def,v0}}:\n{body}')
+
+    assert decoded == {
+        "t": [
+            {"a b": i, '"q"': i + 1, "x-y": i + 2, "def": i + 3, "v0": i + 4}
+            for i in range(n_rows)
+        ]
+    }